@@ -1,23 +1,142 @@
 #!/usr/bin/env python3
-import json, sys
+from __future__ import annotations
+
+import atexit, functools, json, os, sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
 import re
 
+# colorama is only needed on Windows, where the console can't interpret raw
+# ANSI escapes; POSIX terminals take them natively, with no translation
+# layer intercepting every write.
+_IS_WIN = os.name == "nt"
+if _IS_WIN:
+    try:
+        import colorama
+        from colorama import Fore, Style
+    except ImportError:
+        print("Please install colorama via `pip install colorama`.")
+        sys.exit(1)
+else:
+    colorama = None
+
+# Optional: stream-parse large traces instead of materializing the whole
+# JSON document before any work starts.
 try:
-    import colorama
-    from colorama import Fore, Style
+    import ijson
 except ImportError:
-    print("Please install colorama via `pip install colorama`.")
-    sys.exit(1)
+    ijson = None
+
+# Optional: orjson decodes multi-MB traces several times faster than the
+# stdlib when we do have to materialize a whole document. Under PyPy the
+# stdlib json is already JIT-compiled and calling a CPython C extension
+# through cpyext would be slower, so stick with json there. The rest of
+# the script is pure-Python tree walking and string formatting, which
+# PyPy's tracing JIT speeds up several-fold on large traces.
+_IS_PYPY = "__pypy__" in sys.builtin_module_names
+if _IS_PYPY:
+    _loads = json.loads
+else:
+    try:
+        import orjson
+        _loads = orjson.loads
+    except ImportError:
+        _loads = json.loads
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter, Retry
 except ImportError:
     print("Please install requests via `pip install requests`.")
     sys.exit(1)
 
-selector_cache = {}
+# One shared session with keep-alive: repeated 4byte.directory lookups reuse
+# the TCP+TLS connection instead of paying a fresh handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+))
+
+# Color codes hoisted into module constants so the hot tree walk pays one
+# attribute lookup at import time instead of one per f-string interpolation.
+# When stdout is piped (not a TTY) the codes become empty strings and no
+# write-intercepting wrapper is ever installed.
+_IS_TTY = sys.stdout.isatty()
+if not _IS_TTY:
+    G = Y = M = C = B = RED = RST = ""
+elif _IS_WIN:
+    G   = Fore.GREEN
+    Y   = Fore.YELLOW
+    M   = Fore.MAGENTA
+    C   = Fore.CYAN
+    B   = Fore.BLUE
+    RED = Fore.RED
+    RST = Style.RESET_ALL
+else:
+    # Raw ANSI escapes on POSIX; same values colorama would resolve to
+    G   = "\x1b[32m"
+    Y   = "\x1b[33m"
+    M   = "\x1b[35m"
+    C   = "\x1b[36m"
+    B   = "\x1b[34m"
+    RED = "\x1b[31m"
+    RST = "\x1b[0m"
+
+# Pre-built indents indexed by level, so deep nodes don't re-multiply strings,
+# and branch/child-prefix pieces indexed by the is_last flag so per-node
+# string choices are tuple loads instead of conditional expressions
+_INDENT = tuple(" " * (2 * i) for i in range(256))
+_BRANCH = ("├─ ", "└─ ")
+_CHILD_SUFFIX = ("│ ", "  ")
+
+# Argument-line templates built once from the color constants, so the
+# per-arg loop pays a positional .format instead of a full f-string with
+# repeated color interpolations
+_ARG_FMT_TYPED = M + "{}" + RST + ": " + C + "{}" + RST + " = {}\n"
+_ARG_FMT_PLAIN = M + "{}" + RST + " = {}\n"
+
+# Common Rust type prefixes stripped for readability, as one precompiled
+# alternation: a single scan per type instead of one str.replace per prefix
+_TYPE_PREFIX_RE = re.compile(
+    r"alloy_primitives::bits::(?:address|fixed)::"
+    r"|alloy_primitives::signed::int::"
+    r"|ruint::"
+    r"|stylus_sdk::host::"
+    r"|alloc::vec::"
+)
+
+# Selector -> signature lookups are persisted across runs so repeated
+# invocations skip the 4byte.directory round-trips entirely.
+_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "walnut" / "4byte.json"
+
+try:
+    with open(_CACHE_PATH) as _f:
+        selector_cache = json.load(_f)
+    if not isinstance(selector_cache, dict):
+        # Valid JSON but the wrong shape (hand-edited or foreign file)
+        selector_cache = {}
+except Exception:
+    selector_cache = {}
+
+
+def _save_selector_cache():
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so concurrent runs can't
+        # interleave writes and leave a truncated cache behind.
+        tmp_path = _CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            # Only persist successful decodes; failed lookups (value == key)
+            # stay in-memory so a flaky network doesn't poison future runs.
+            json.dump({k: v for k, v in selector_cache.items() if v != k}, f)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass
+
+atexit.register(_save_selector_cache)
+
 
 def decode_selector(sel: str) -> str:
     """Decode a function selector (4byte) to its signature using 4byte.directory API"""
@@ -26,7 +145,7 @@ def decode_selector(sel: str) -> str:
 
     sig = sel
     try:
-        r = requests.get(
+        r = _SESSION.get(
             "https://www.4byte.directory/api/v1/signatures/",
             params={"hex_signature": sel},
             timeout=2
@@ -43,39 +162,176 @@ def decode_selector(sel: str) -> str:
     return sig
 
 
-def build_call_tree(call_list):
+def iter_sol_calls(sol_calls):
+    """Iterate over all Solidity calls, including nested child calls"""
+    stack = list(sol_calls)
+    while stack:
+        call = stack.pop()
+        yield call
+        stack.extend(call.get("calls", ()))
+
+
+def prefetch_selectors(sol_calls):
+    """Resolve all unresolved selectors concurrently before the tree walk"""
+    selectors = {
+        c["input"][:10]
+        for c in iter_sol_calls(sol_calls)
+        if len(c.get("input", "")) >= 10
+    }
+    selectors.difference_update(selector_cache)
+    if not selectors:
+        return
+    # Overlap the 4byte.directory round-trips: K sequential lookups at up
+    # to 2s each collapse to roughly one RTT for the whole batch.
+    with ThreadPoolExecutor(max_workers=min(16, len(selectors))) as ex:
+        for _ in ex.map(decode_selector, selectors):
+            pass
+
+
+def load_walnut_trace(walnut_file):
+    """Load a trace file, returning (status, iterable of calls).
+
+    With ijson installed the call list is streamed one call at a time, so
+    peak memory tracks the tree rather than the JSON text and tree building
+    starts before the whole file is parsed.
+    """
+    if ijson is None:
+        walnut_json = _loads(Path(walnut_file).read_bytes())
+        return walnut_json.get("status", "success"), walnut_json.get("calls", [])
+
+    status = "success"
+    with open(walnut_file, "rb") as f:
+        for status in ijson.items(f, "status"):
+            break
+
+    def stream():
+        with open(walnut_file, "rb") as f:
+            yield from ijson.items(f, "calls.item")
+
+    return status, stream()
+
+
+class OutputBuffer:
+    """Batches output lines but caps peak memory on huge traces.
+
+    Appended strings accumulate in a bytearray that is flushed through the
+    underlying write once it crosses _LIMIT, so throughput stays near one
+    syscall per megabyte while the joined output never has to fit in
+    memory all at once. Exposes append() so the walkers can treat it like
+    the plain list it replaces.
+    """
+    _LIMIT = 1 << 20  # flush at 1 MiB
+
+    __slots__ = ("_buf", "_write")
+
+    def __init__(self, write):
+        self._buf = bytearray()
+        self._write = write
+
+    def append(self, s: str) -> None:
+        buf = self._buf
+        buf += s.encode()
+        if len(buf) >= self._LIMIT:
+            # The bytearray is a bytes-like object, so it goes to write()
+            # directly; wrapping it in a memoryview would block the resize
+            # below on implementations (PyPy) that defer destruction of
+            # the exported view.
+            self._write(buf)
+            del buf[:]
+
+    def flush(self) -> None:
+        if self._buf:
+            self._write(self._buf)
+            del self._buf[:]
+
+
+class Frame:
+    """A single call frame, slotted for compact storage and fast access.
+
+    Attribute access on a slotted object is an offset load instead of a
+    per-access string hash, and the per-frame dict overhead goes away.
+    Interning the repeated function/file/type strings here collapses
+    duplicates across frames to shared objects.
+    """
+    __slots__ = ("call_id", "parent_call_id", "function", "file", "line",
+                 "args", "error", "error_message")
+
+    def __init__(self, d, intern=sys.intern):
+        self.call_id = d["call_id"]
+        self.parent_call_id = d["parent_call_id"]
+        self.function = intern(d.get("function", "<unknown>"))
+        self.file = intern(d.get("file", "<no file>"))
+        self.line = d.get("line", 0)
+        self.args = d.get("args", [])
+        self.error = d.get("error", False)
+        self.error_message = d.get("error_message", "")
+        for a in self.args:
+            t = a.get("type")
+            if t:
+                a["type"] = intern(t)
+
+
+def iter_call_nodes(roots: list[Frame], tree: dict[int, list[Frame]]):
+    """Iterate over all frames in the tree in depth-first (trace) order"""
+    stack = list(reversed(roots))
+    while stack:
+        call = stack.pop()
+        yield call
+        stack.extend(reversed(tree.get(call.call_id, ())))
+
+
+def build_call_tree(call_list) -> tuple[list[Frame], dict[int, list[Frame]]]:
     """Build a tree representation of the function call trace"""
-    tree, roots = defaultdict(list), []
-    for c in call_list:
-        p = c["parent_call_id"]
+    # Plain dict + setdefault beats defaultdict here: no __missing__ hook
+    # fires for every new parent, and the tree stays a plain dict for the
+    # bound tree.get used in the traversal. Accepts any iterable, including
+    # the streaming parser from load_walnut_trace. Raw call dicts are
+    # converted to slotted Frame objects in the same pass.
+    tree, roots = {}, []
+    for d in call_list:
+        c = Frame(d)
+        p = c.parent_call_id
         if p == 0:
             roots.append(c)
         else:
-            tree[p].append(c)
+            tree.setdefault(p, []).append(c)
     return roots, tree
 
 
-def print_sol_node(sol_call, level, is_last, prefix):
-    """Print a Solidity call node in the function call tree"""
-    pad    = " " * (level * 2)
-    branch = "└─ " if is_last else "├─ "
-    newp   = prefix + ("  " if is_last else "│ ")
-    frm    = sol_call.get("from")
-    to     = sol_call.get("to")
-    raw    = sol_call.get("input", "")[:10]
-    decoded = decode_selector(raw)
-    print(
-        f"{prefix}{pad}{branch}"
-        f"{Fore.CYAN}solidity➤{Style.RESET_ALL} "
-        f"{Fore.GREEN}{frm}{Style.RESET_ALL} → {Fore.BLUE}{to}{Style.RESET_ALL} "
-        f"(entry_point: {raw} <-> {Fore.MAGENTA}{decoded}{Style.RESET_ALL})"
-    )
-    for i, ch in enumerate(sol_call.get("calls", [])):
-        print_sol_node(ch, level+1, i==len(sol_call["calls"])-1, newp)
-
-
-def extract_function_name(symbol):
+def print_sol_node(sol_call: dict, level: int, is_last: bool, prefix: str, out: OutputBuffer) -> None:
+    """Print a Solidity call node and its children in the function call tree"""
+    # Iterative DFS: an explicit stack avoids per-node Python call overhead
+    # and the recursion limit on deep call chains. Children are pushed in
+    # reverse so the printed order matches the recursive version.
+    stack = [(sol_call, level, is_last, prefix)]
+    while stack:
+        call, level, is_last, prefix = stack.pop()
+        pad    = _INDENT[level] if level < 256 else " " * (level * 2)
+        branch = _BRANCH[is_last]
+        newp   = prefix + _CHILD_SUFFIX[is_last]
+        frm    = call.get("from")
+        to     = call.get("to")
+        raw    = call.get("input", "")[:10]
+        # Signatures are pre-decoded during map construction; fall back to
+        # the selector cache only for calls that never went through it
+        decoded = call.get("_decoded") or decode_selector(raw)
+        out.append(
+            f"{prefix}{pad}{branch}"
+            f"{C}solidity➤{RST} "
+            f"{G}{frm}{RST} → {B}{to}{RST} "
+            f"(entry_point: {raw} <-> {M}{decoded}{RST})\n"
+        )
+        children = call.get("calls", [])
+        last_idx = len(children) - 1
+        for i in range(last_idx, -1, -1):
+            stack.append((children[i], level + 1, i == last_idx, newp))
+
+
+@functools.lru_cache(maxsize=4096)
+def extract_function_name(symbol: str) -> str:
     """Extract just the function name from a fully qualified function name"""
+    # Traces repeat the same symbols thousands of times; memoize so the
+    # rsplit work happens once per unique symbol.
     without_hash = symbol.rsplit("::", 1)[0]
     return without_hash.rsplit("::", 1)[-1]
 
@@ -109,102 +365,97 @@ def get_argument_names(args):
     return [arg.get("name", "") for arg in args if arg.get("name")]
 
 
-def matches_argument_pattern(args, sol_call):
-    """Check if the function arguments match the Solidity call pattern"""
-    # Get the Solidity call details
-    input_data = sol_call.get("input", "")
-
-    num_of_sol_args = len(input_data) - 10
-    # It should only have "context" and "self"
-    num_of_rust_args = len(args) - 2
-
-    # For functions with no arguments, check if any arg contains the target address
-    # TODO: Check ABI and encoded hash instead!
-    if num_of_sol_args == num_of_rust_args:
-        return True
-    else:
-        return False
-
-
-def print_call_node(call, tree, sol_function_map, level=0, is_last=False, prefix=""):
-    """Print a function call node and its children in the tree"""
-    pad    = " " * (level * 2)
-    branch = "└─ " if is_last else "├─ "
-    newp   = prefix + ("  " if is_last else "│ ")
-    fn     = call.get("function","<unknown>")
-    fl     = call.get("file","<no file>")
-    ln     = call.get("line",0)
-    args   = call.get("args", [])
-    is_error = call.get("error", False)
-
-    # Error marker and coloring
-    error_marker = f" {Fore.RED}✗ ERROR{Style.RESET_ALL}" if is_error else ""
-    fn_color = Fore.RED if is_error else Fore.YELLOW
-
-    # Print the function call node
-    print(
-        f"{prefix}{pad}{branch}"
-        f"{Fore.GREEN}#{call['call_id']}{Style.RESET_ALL} "
-        f"{fn_color}{fn}{Style.RESET_ALL} "
-        f"({fl}:{ln}){error_marker}"
-    )
-
-    # Print error message if present
-    if is_error and call.get("error_message"):
-        print(f"{prefix}{pad}  {Fore.RED}↳ {call['error_message']}{Style.RESET_ALL}")
-
-    # Print function arguments with type info
-    for arg in call.get("args", []):
-        arg_name = arg.get('name', '<unknown>')
-        arg_type = arg.get('type', '')
-        arg_value = arg.get('value', '<unavailable>')
-
-        # Simplify common Rust type names for readability
-        if arg_type:
-            # Shorten common prefixes
-            short_type = arg_type.replace('alloy_primitives::bits::address::', '')
-            short_type = short_type.replace('alloy_primitives::signed::int::', '')
-            short_type = short_type.replace('alloy_primitives::bits::fixed::', '')
-            short_type = short_type.replace('ruint::', '')
-            short_type = short_type.replace('stylus_sdk::host::', '')
-            short_type = short_type.replace('alloc::vec::', '')
-            print(f"{prefix}{pad}  {Fore.MAGENTA}{arg_name}{Style.RESET_ALL}: {Fore.CYAN}{short_type}{Style.RESET_ALL} = {arg_value}")
-        else:
-            print(f"{prefix}{pad}  {Fore.MAGENTA}{arg_name}{Style.RESET_ALL} = {arg_value}")
-
-    dfn = extract_function_name(fn)
-
-    if dfn in sol_function_map:
-        sol_call = sol_function_map[dfn]
-        # TODO: Check against ABI instead.
-        if matches_argument_pattern(args, sol_call):
-            print_sol_node(sol_call, level+1, True, newp)
-
-    # Process child nodes
-    children = tree.get(call["call_id"], [])
-    for i, ch in enumerate(children):
-        print_call_node(
-            ch, tree, sol_function_map,
-            level+1,
-            i==len(children)-1,
-            newp
+def print_call_tree(roots: list[Frame], tree: dict[int, list[Frame]],
+                    sol_function_map: dict, out: OutputBuffer) -> None:
+    """Print the function call tree rooted at the given calls"""
+    # Iterative DFS with an explicit stack instead of recursion: skips the
+    # per-node frame setup cost and removes the recursion limit as a depth
+    # ceiling. One stack list is reused across all roots; children are pushed
+    # in reverse so output order matches the old recursive traversal.
+    # Lines are appended to `out` and flushed by the caller in one write,
+    # instead of paying print() dispatch and a flush per line.
+    tree_get = tree.get
+    stack = [(r, 0, i == 0, "") for i, r in enumerate(reversed(roots))]
+    while stack:
+        call, level, is_last, prefix = stack.pop()
+        pad    = _INDENT[level] if level < 256 else " " * (level * 2)
+        branch = _BRANCH[is_last]
+        newp   = prefix + _CHILD_SUFFIX[is_last]
+        fn     = call.function
+        fl     = call.file
+        ln     = call.line
+        args   = call.args
+        is_error = call.error
+
+        # Error marker and coloring
+        error_marker = f" {RED}✗ ERROR{RST}" if is_error else ""
+        fn_color = RED if is_error else Y
+
+        # Print the function call node
+        out.append(
+            f"{prefix}{pad}{branch}"
+            f"{G}#{call.call_id}{RST} "
+            f"{fn_color}{fn}{RST} "
+            f"({fl}:{ln}){error_marker}\n"
         )
 
+        # Print error message if present
+        if is_error and call.error_message:
+            out.append(f"{prefix}{pad}  {RED}↳ {call.error_message}{RST}\n")
+
+        # Print function arguments with type info
+        arg_indent = f"{prefix}{pad}  "
+        for arg in args:
+            arg_name = arg.get('name', '<unknown>')
+            arg_type = arg.get('type', '')
+            arg_value = arg.get('value', '<unavailable>')
+
+            # Simplify common Rust type names for readability
+            if arg_type:
+                short_type = _TYPE_PREFIX_RE.sub('', arg_type)
+                out.append(arg_indent + _ARG_FMT_TYPED.format(arg_name, short_type, arg_value))
+            else:
+                out.append(arg_indent + _ARG_FMT_PLAIN.format(arg_name, arg_value))
+
+        if sol_function_map:
+            sol_call = sol_function_map.get(extract_function_name(fn))
+            # Rust args minus "context" and "self" vs. the cached hex-arg
+            # length of the Solidity input.
+            # TODO: Check against ABI and encoded hash instead!
+            if sol_call is not None and len(args) - 2 == sol_call["_nargs_hex"]:
+                print_sol_node(sol_call, level+1, True, newp, out)
+
+        # Push child nodes (reversed, so the stack pops them in order)
+        children = tree_get(call.call_id, ())
+        last_idx = len(children) - 1
+        for i in range(last_idx, -1, -1):
+            stack.append((children[i], level + 1, i == last_idx, newp))
+
 
 def create_sol_function_map(sol_calls):
     """
     Create a mapping from function names to Solidity calls by decoding the selectors
     """
+    # Remember the decoded signature on every call (nested ones included,
+    # already resolved by the selector prefetch) so the printer doesn't
+    # redo the lookup per printed node
+    for call in iter_sol_calls(sol_calls):
+        input_data = call.get("input", "")
+        if input_data and len(input_data) >= 10:
+            call["_decoded"] = decode_selector(input_data[:10])
+
     function_map = {}
     for call in sol_calls:
         input_data = call.get("input", "")
         if input_data and len(input_data) >= 10:  # 0x + 8 hex chars (4 bytes)
-            selector = input_data[:10]
-            decoded_func = decode_selector(selector)
+            decoded_func = call["_decoded"]
 
             # Extract just the function name without parameters
             if "(" in decoded_func:
                 function_name = decoded_func.split("(")[0]
+                # Cache the hex-arg length so the per-node argument match
+                # is a plain integer compare
+                call["_nargs_hex"] = len(input_data) - 10
                 function_map[function_name] = call
                 # print(f"Mapped function: {function_name} -> {selector}")
 
@@ -213,7 +464,7 @@ def create_sol_function_map(sol_calls):
 
 def print_solidity_calls(sol_calls):
     """Print all Solidity calls from the JSON file"""
-    print(f"{Fore.CYAN}=== SOLIDITY CALLS FROM JSON ==={Style.RESET_ALL}")
+    print(f"{C}=== SOLIDITY CALLS FROM JSON ==={RST}")
 
     if not sol_calls:
         print("No Solidity calls found in the JSON file")
@@ -244,7 +495,8 @@ def print_solidity_calls(sol_calls):
 
 
 def main():
-    colorama.init(autoreset=True)
+    if _IS_WIN and _IS_TTY:
+        colorama.init(autoreset=True)
     if len(sys.argv) < 2:
         print("usage: pretty-print-trace WALNUT_JSON [SOL_JSON]")
         sys.exit(1)
@@ -254,19 +506,20 @@ def main():
         print(f"ERROR: No such file: {walnut_file}")
         sys.exit(1)
 
-    walnut_json = json.load(open(walnut_file))
-    status = walnut_json.get("status", "success")
-    walnut = walnut_json.get("calls", [])
+    status, walnut = load_walnut_trace(walnut_file)
+
+    # Build call tree (consumes the call stream)
+    roots, tree = build_call_tree(walnut)
 
     # Print error summary if status is error
     if status == "error":
-        error_call = next((c for c in walnut if c.get("error")), None)
+        error_call = next((c for c in iter_call_nodes(roots, tree) if c.error), None)
         if error_call:
-            print(f"{Fore.RED}ERROR: Transaction reverted{Style.RESET_ALL}")
-            print(f"  Location: {error_call.get('file', '')}:{error_call.get('line', 0)}")
-            print(f"  Function: {Fore.RED}{error_call.get('function', 'unknown')}{Style.RESET_ALL}")
-            if error_call.get("error_message"):
-                print(f"  Message: {Fore.RED}{error_call['error_message']}{Style.RESET_ALL}")
+            print(f"{RED}ERROR: Transaction reverted{RST}")
+            print(f"  Location: {error_call.file}:{error_call.line}")
+            print(f"  Function: {RED}{error_call.function}{RST}")
+            if error_call.error_message:
+                print(f"  Message: {RED}{error_call.error_message}{RST}")
                 
     sol_calls = []
     sol_function_map = {}
@@ -274,9 +527,12 @@ def main():
     if len(sys.argv) > 2:
         sol_file = Path(sys.argv[2])
         if sol_file.is_file():
-            sol_json = json.load(open(sol_file))
+            sol_json = _loads(sol_file.read_bytes())
             sol_calls = sol_json.get("calls", [])
 
+            # Resolve every selector up front, in parallel
+            prefetch_selectors(sol_calls)
+
             # Print detailed information about all Solidity calls
             # This can be used for debugging:
             # print_solidity_calls(sol_calls)
@@ -286,12 +542,19 @@ def main():
             # This can be used for debugging:
             # print(f"Created function map with {len(sol_function_map)} entries: {list(sol_function_map.keys())}")
 
-    # Build call tree
-    roots, tree = build_call_tree(walnut)
-
-    print(f"{Fore.CYAN}=== WALNUT FUNCTION CALL TREE ==={Style.RESET_ALL}")
-    for i, root in enumerate(roots):
-        print_call_node(root, tree, sol_function_map, 0, i==len(roots)-1, "")
+    # Accumulate output and flush in bounded chunks: near-single-write
+    # throughput without ever holding the whole rendering in memory.
+    # Everywhere except a Windows TTY (where colorama must translate the
+    # escapes) chunks go straight to sys.stdout.buffer as bytes, skipping
+    # text-mode newline translation.
+    if _IS_WIN and _IS_TTY:
+        write = lambda b: sys.stdout.write(bytes(b).decode())
+    else:
+        write = sys.stdout.buffer.write
+    out = OutputBuffer(write)
+    out.append(f"{C}=== WALNUT FUNCTION CALL TREE ==={RST}\n")
+    print_call_tree(roots, tree, sol_function_map, out)
+    out.flush()
 
 if __name__ == "__main__":
     main()